@@ -3,6 +3,7 @@ Pytest configuration and fixtures for nightswatch tests.
 """
 import os
 import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -69,6 +70,22 @@ subtitles:
     return temp_config_dir
 
 
+@pytest.fixture
+def temp_config_with_unicode(temp_config_dir):
+    """Config with special-character and non-ASCII channel names."""
+    config = {
+        "channels": [
+            {"name": "Test & Friends <3", "id": "UCspecial123"},
+            {"name": "日本語チャンネル", "id": "UCjapanese123"},
+        ],
+        "subtitles": {"languages": ["en"], "prefer_manual": True},
+    }
+    with open(temp_config_dir, "w") as f:
+        yaml.dump(config, f, allow_unicode=True)
+
+    return temp_config_dir
+
+
 @pytest.fixture
 def nightswatch_path():
     """Path to the nightswatch script."""
@@ -79,12 +96,58 @@ def nightswatch_path():
 
 
 @pytest.fixture
-def mock_yt_dlp(monkeypatch, tmp_path):
+def run_script():
+    """
+    Run any executable the way the gate runs nightswatch.
+
+    Used directly only for baselines (e.g. startup timing) that must share
+    the same launcher and environment as nightswatch itself.
+    """
+    def _run(script, *args, config, path_prepend=None, env_overrides=None):
+        env = os.environ.copy()
+        env["YTMON_CONFIG"] = str(config)
+        if path_prepend is not None:
+            env["PATH"] = f"{path_prepend}:{env.get('PATH', '')}"
+        if env_overrides:
+            env.update(env_overrides)
+
+        return subprocess.run(
+            [str(script), *args],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+    return _run
+
+
+@pytest.fixture
+def run_nightswatch(nightswatch_path, run_script):
+    """
+    Run a nightswatch command against a given config file.
+
+    Every gate test goes through this single entry point, so config and
+    PATH setup for the installed script live in one place.
+
+    Usage:
+        result = run_nightswatch("add", url, config=path, path_prepend=mock_dir)
+    """
+    def _run(*args, **kwargs):
+        return run_script(nightswatch_path, *args, **kwargs)
+
+    return _run
+
+
+@pytest.fixture
+def mock_yt_dlp(tmp_path):
     """
     Mock uvx yt-dlp for testing without network calls.
     Creates a fake uvx script that returns predictable values.
+    Pass `path_prepend=mock_yt_dlp.parent` to run_nightswatch to use it.
     """
-    mock_script = tmp_path / "uvx"
+    mock_dir = tmp_path / "mock_yt_dlp"
+    mock_dir.mkdir(exist_ok=True)
+    mock_script = mock_dir / "uvx"
     mock_script.write_text('''#!/bin/bash
 # Mock uvx for testing
 if [[ "$*" == *"--print channel_id"* ]]; then
@@ -94,11 +157,31 @@ elif [[ "$*" == *"--print channel"* ]]; then
 fi
 ''')
     mock_script.chmod(0o755)
-    
-    # Prepend mock to PATH
-    new_path = f"{tmp_path}:{os.environ.get('PATH', '')}"
-    monkeypatch.setenv("PATH", new_path)
-    
+    return mock_script
+
+
+@pytest.fixture
+def mock_yt_dlp_existing(tmp_path, temp_config_with_channel):
+    """
+    Mock uvx yt-dlp that resolves to the channel in temp_config_with_channel.
+    Use it to exercise the duplicate-detection path of `add`.
+    Each call is appended to `calls.log` next to the script.
+    """
+    with open(temp_config_with_channel) as f:
+        channel = yaml.safe_load(f)["channels"][0]
+
+    mock_dir = tmp_path / "mock_yt_dlp_existing"
+    mock_dir.mkdir(exist_ok=True)
+    mock_script = mock_dir / "uvx"
+    mock_script.write_text(f'''#!/bin/bash
+echo "$*" >> "$(dirname "$0")/calls.log"
+if [[ "$*" == *"--print channel_id"* ]]; then
+    echo "{channel["id"]}"
+elif [[ "$*" == *"--print channel"* ]]; then
+    echo "{channel["name"]}"
+fi
+''')
+    mock_script.chmod(0o755)
     return mock_script
 
 
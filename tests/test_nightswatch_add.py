@@ -4,8 +4,6 @@ Tests for nightswatch `add` command.
 Gate Pattern: These tests must pass before changes to nightswatch are accepted.
 Run with: pytest ~/code/ytmon/tests/ -v
 """
-import os
-import subprocess
 from pathlib import Path
 
 import pytest
@@ -15,16 +13,12 @@ import yaml
 class TestAddChannel:
     """Tests for the nightswatch add command."""
 
-    def test_add_channel_by_url(self, temp_config_dir, mock_yt_dlp, nightswatch_path):
+    def test_add_channel_by_url(self, temp_config_dir, mock_yt_dlp, run_nightswatch):
         """Adding a channel by URL should add it to config."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "add", "https://youtube.com/@TestChannel"],
-            env=env,
-            capture_output=True,
-            text=True,
+        result = run_nightswatch(
+            "add", "https://youtube.com/@TestChannel",
+            config=temp_config_dir,
+            path_prepend=mock_yt_dlp.parent,
         )
         
         # Should succeed
@@ -40,39 +34,19 @@ class TestAddChannel:
         assert config["channels"][0]["name"] == "Mock Channel Name"
 
     def test_add_duplicate_channel_no_duplicate(
-        self, temp_config_with_channel, nightswatch_path
+        self, temp_config_with_channel, mock_yt_dlp_existing, run_nightswatch
     ):
         """Adding an already-existing channel should not duplicate it."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_with_channel)
-        
         # Read original config
         with open(temp_config_with_channel) as f:
             original_config = yaml.safe_load(f)
         original_count = len(original_config["channels"])
-        original_id = original_config["channels"][0]["id"]
-        
-        # Try to add the same channel (mock a scenario where yt-dlp returns same ID)
-        # We need to create a custom mock for this test
-        mock_dir = Path(temp_config_with_channel).parent / "mock_bin"
-        mock_dir.mkdir(exist_ok=True)
-        mock_uvx = mock_dir / "uvx"
-        mock_uvx.write_text(f'''#!/bin/bash
-if [[ "$*" == *"--print channel_id"* ]]; then
-    echo "{original_id}"
-elif [[ "$*" == *"--print channel"* ]]; then
-    echo "Test Channel"
-fi
-''')
-        mock_uvx.chmod(0o755)
-        
-        env["PATH"] = f"{mock_dir}:{env.get('PATH', '')}"
         
-        result = subprocess.run(
-            [str(nightswatch_path), "add", "https://youtube.com/@TestChannel"],
-            env=env,
-            capture_output=True,
-            text=True,
+        # mock_yt_dlp_existing resolves to the channel already in the config
+        result = run_nightswatch(
+            "add", "https://youtube.com/@TestChannel",
+            config=temp_config_with_channel,
+            path_prepend=mock_yt_dlp_existing.parent,
         )
         
         # Should succeed but indicate already exists
@@ -85,11 +59,8 @@ fi
         
         assert len(new_config["channels"]) == original_count
 
-    def test_add_invalid_url_handling(self, temp_config_dir, nightswatch_path):
+    def test_add_invalid_url_handling(self, temp_config_dir, run_nightswatch):
         """Invalid URLs should produce a clear error."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
         # Create mock that fails for invalid URLs
         mock_dir = Path(temp_config_dir).parent / "mock_bin"
         mock_dir.mkdir(exist_ok=True)
@@ -102,30 +73,20 @@ fi
 echo "UCvalid123"
 ''')
         mock_uvx.chmod(0o755)
-        env["PATH"] = f"{mock_dir}:{env.get('PATH', '')}"
         
-        result = subprocess.run(
-            [str(nightswatch_path), "add", "not-a-valid-url"],
-            env=env,
-            capture_output=True,
-            text=True,
+        result = run_nightswatch(
+            "add", "not-a-valid-url",
+            config=temp_config_dir,
+            path_prepend=mock_dir,
         )
         
         # Should fail with error
         assert result.returncode != 0
         assert "error" in result.stderr.lower() or "could not" in result.stderr.lower()
 
-    def test_add_missing_url_shows_usage(self, temp_config_dir, nightswatch_path):
+    def test_add_missing_url_shows_usage(self, temp_config_dir, run_nightswatch):
         """Calling add without a URL should show usage."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "add"],
-            env=env,
-            capture_output=True,
-            text=True,
-        )
+        result = run_nightswatch("add", config=temp_config_dir)
         
         assert result.returncode != 0
         assert "usage" in result.stderr.lower()
@@ -134,15 +95,14 @@ echo "UCvalid123"
 class TestConfigIntegrity:
     """Tests ensuring config file integrity after add operations."""
 
-    def test_config_remains_valid_yaml(self, temp_config_dir, mock_yt_dlp, nightswatch_path):
+    def test_config_remains_valid_yaml(
+        self, temp_config_dir, mock_yt_dlp, run_nightswatch
+    ):
         """Config should remain valid YAML after add."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
-        subprocess.run(
-            [str(nightswatch_path), "add", "https://youtube.com/@TestChannel"],
-            env=env,
-            capture_output=True,
+        run_nightswatch(
+            "add", "https://youtube.com/@TestChannel",
+            config=temp_config_dir,
+            path_prepend=mock_yt_dlp.parent,
         )
         
         # Should parse without errors
@@ -154,7 +114,7 @@ class TestConfigIntegrity:
         assert isinstance(config["channels"], list)
 
     def test_config_preserves_other_settings(
-        self, temp_config_dir, mock_yt_dlp, nightswatch_path
+        self, temp_config_dir, mock_yt_dlp, run_nightswatch
     ):
         """Adding a channel should not clobber other config settings."""
         # Add custom settings to config
@@ -167,13 +127,10 @@ class TestConfigIntegrity:
         with open(temp_config_dir, "w") as f:
             yaml.dump(config, f)
         
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
-        subprocess.run(
-            [str(nightswatch_path), "add", "https://youtube.com/@TestChannel"],
-            env=env,
-            capture_output=True,
+        run_nightswatch(
+            "add", "https://youtube.com/@TestChannel",
+            config=temp_config_dir,
+            path_prepend=mock_yt_dlp.parent,
         )
         
         # Verify settings preserved
@@ -184,16 +141,13 @@ class TestConfigIntegrity:
         assert new_config["subtitles"]["languages"] == ["en", "de", "fr"]
 
     def test_config_channel_format_correct(
-        self, temp_config_dir, mock_yt_dlp, nightswatch_path
+        self, temp_config_dir, mock_yt_dlp, run_nightswatch
     ):
         """Added channels should have correct format (name and id)."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
-        subprocess.run(
-            [str(nightswatch_path), "add", "https://youtube.com/@TestChannel"],
-            env=env,
-            capture_output=True,
+        run_nightswatch(
+            "add", "https://youtube.com/@TestChannel",
+            config=temp_config_dir,
+            path_prepend=mock_yt_dlp.parent,
         )
         
         with open(temp_config_dir) as f:
@@ -211,17 +165,13 @@ class TestEdgeCases:
     """Edge case tests for robustness."""
 
     def test_add_to_empty_channels_list(
-        self, temp_config_dir, mock_yt_dlp, nightswatch_path
+        self, temp_config_dir, mock_yt_dlp, run_nightswatch
     ):
         """Should handle config with empty channels list."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "add", "https://youtube.com/@TestChannel"],
-            env=env,
-            capture_output=True,
-            text=True,
+        result = run_nightswatch(
+            "add", "https://youtube.com/@TestChannel",
+            config=temp_config_dir,
+            path_prepend=mock_yt_dlp.parent,
         )
         
         assert result.returncode == 0
@@ -232,12 +182,9 @@ class TestEdgeCases:
         assert len(config["channels"]) == 1
 
     def test_add_multiple_channels_sequentially(
-        self, temp_config_dir, nightswatch_path
+        self, temp_config_dir, run_nightswatch
     ):
         """Should correctly add multiple channels in sequence."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
         channels = [
             ("UC111111111111111111111", "Channel One"),
             ("UC222222222222222222222", "Channel Two"),
@@ -257,13 +204,10 @@ fi
 ''')
             mock_uvx.chmod(0o755)
             
-            test_env = env.copy()
-            test_env["PATH"] = f"{mock_dir}:{env.get('PATH', '')}"
-            
-            subprocess.run(
-                [str(nightswatch_path), "add", f"https://youtube.com/@test{channel_id[:6]}"],
-                env=test_env,
-                capture_output=True,
+            run_nightswatch(
+                "add", f"https://youtube.com/@test{channel_id[:6]}",
+                config=temp_config_dir,
+                path_prepend=mock_dir,
             )
         
         with open(temp_config_dir) as f:
@@ -4,28 +4,14 @@ Tests for nightswatch `list` command.
 Gate Pattern: These tests must pass before changes to nightswatch list are accepted.
 Run with: pytest ~/code/ytmon/tests/ -v
 """
-import os
-import subprocess
-from pathlib import Path
-
-import pytest
-import yaml
 
 
 class TestListChannels:
     """Tests for the nightswatch list command."""
 
-    def test_list_shows_header(self, temp_config_with_channel, nightswatch_path):
+    def test_list_shows_header(self, temp_config_with_channel, run_nightswatch):
         """List should show a header."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_with_channel)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "list"],
-            env=env,
-            capture_output=True,
-            text=True,
-        )
+        result = run_nightswatch("list", config=temp_config_with_channel)
         
         # Should succeed and show header
         assert result.returncode == 0
@@ -33,18 +19,10 @@ class TestListChannels:
         assert "channel" in output or "watch" in output
 
     def test_list_shows_configured_channels(
-        self, temp_config_with_channels, nightswatch_path
+        self, temp_config_with_channels, run_nightswatch
     ):
         """List should display all configured channels."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_with_channels)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "list"],
-            env=env,
-            capture_output=True,
-            text=True,
-        )
+        result = run_nightswatch("list", config=temp_config_with_channels)
         
         assert result.returncode == 0
         output = result.stdout
@@ -53,35 +31,19 @@ class TestListChannels:
         assert "Channel Alpha" in output
         assert "Channel Beta" in output
 
-    def test_list_empty_channels(self, temp_config_dir, nightswatch_path):
+    def test_list_empty_channels(self, temp_config_dir, run_nightswatch):
         """List with no channels should indicate empty."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "list"],
-            env=env,
-            capture_output=True,
-            text=True,
-        )
+        result = run_nightswatch("list", config=temp_config_dir)
         
         # Should succeed (not crash) even with no channels
         # Output might be empty or say "no channels"
         assert result.returncode == 0
 
     def test_list_shows_channel_ids(
-        self, temp_config_with_channels, nightswatch_path
+        self, temp_config_with_channels, run_nightswatch
     ):
         """List should display channel IDs."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_with_channels)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "list"],
-            env=env,
-            capture_output=True,
-            text=True,
-        )
+        result = run_nightswatch("list", config=temp_config_with_channels)
         
         assert result.returncode == 0
         output = result.stdout
@@ -95,46 +57,18 @@ class TestListEdgeCases:
     """Edge case tests for list command."""
 
     def test_list_with_special_characters_in_name(
-        self, temp_config_dir, nightswatch_path
+        self, temp_config_with_unicode, run_nightswatch
     ):
         """Channel names with special characters should display correctly."""
-        # Create config with special characters
-        config = {
-            "channels": [
-                {"name": "Test & Friends <3", "id": "UCspecial123"},
-                {"name": "日本語チャンネル", "id": "UCjapanese123"},
-            ],
-            "subtitles": {"languages": ["en"], "prefer_manual": True},
-        }
-        
-        with open(temp_config_dir, "w") as f:
-            yaml.dump(config, f, allow_unicode=True)
-        
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_dir)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "list"],
-            env=env,
-            capture_output=True,
-            text=True,
-        )
+        result = run_nightswatch("list", config=temp_config_with_unicode)
         
         # Should not crash with special characters
         assert result.returncode == 0
 
     def test_list_returns_zero_exit_code(
-        self, temp_config_with_channel, nightswatch_path
+        self, temp_config_with_channel, run_nightswatch
     ):
         """List should always return exit code 0 on success."""
-        env = os.environ.copy()
-        env["YTMON_CONFIG"] = str(temp_config_with_channel)
-        
-        result = subprocess.run(
-            [str(nightswatch_path), "list"],
-            env=env,
-            capture_output=True,
-            text=True,
-        )
+        result = run_nightswatch("list", config=temp_config_with_channel)
         
         assert result.returncode == 0
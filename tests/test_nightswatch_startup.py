@@ -0,0 +1,124 @@
+"""
+Startup-time tests for nightswatch fast paths.
+
+Gate Pattern: `list` and the duplicate check in `add` are run interactively and
+from shell prompts/completions, so they must stay within a fixed startup budget.
+Run with: pytest ~/code/ytmon/tests/ -v
+
+The budget is relative: each command is timed against a no-op script run
+through the same launcher, so process-spawn and shell startup cost (which vary
+with machine load) cancel out. What remains is nightswatch's own work.
+"""
+import time
+
+import pytest
+
+# Budget for nightswatch's own work, above the baseline.
+STARTUP_BUDGET_SECONDS = 0.050
+
+# Best-of-N smooths out scheduler noise without hiding a slow code path.
+RUNS = 5
+
+
+def best_times(*runs):
+    """
+    Fastest wall time of each callable over RUNS rounds, plus its last result.
+
+    Rounds are interleaved so every callable sees the same machine load.
+    """
+    best = [float("inf")] * len(runs)
+    results = [None] * len(runs)
+    for _ in range(RUNS):
+        for i, run in enumerate(runs):
+            start = time.perf_counter()
+            results[i] = run()
+            best[i] = min(best[i], time.perf_counter() - start)
+    return best, results
+
+
+@pytest.fixture
+def baseline_noop(tmp_path):
+    """Bash script that does nothing: the cost of launching any shell script."""
+    script = tmp_path / "baseline_noop"
+    script.write_text("#!/bin/bash\nexit 0\n")
+    script.chmod(0o755)
+    return script
+
+
+class TestListStartup:
+    """`nightswatch list` must start within budget."""
+
+    @pytest.mark.parametrize(
+        "config_fixture",
+        [
+            "temp_config_dir",
+            "temp_config_with_channel",
+            "temp_config_with_channels",
+            "temp_config_with_unicode",
+        ],
+    )
+    def test_list_within_budget(
+        self, request, config_fixture, run_nightswatch, run_script, baseline_noop
+    ):
+        """List should stay within budget for every config shape the list tests use."""
+        config = request.getfixturevalue(config_fixture)
+
+        (command, baseline), (result, _) = best_times(
+            lambda: run_nightswatch("list", config=config),
+            lambda: run_script(baseline_noop, config=config),
+        )
+        elapsed = command - baseline
+
+        assert result.returncode == 0
+        assert elapsed < STARTUP_BUDGET_SECONDS, (
+            f"list took {elapsed * 1000:.1f} ms over baseline "
+            f"(budget {STARTUP_BUDGET_SECONDS * 1000:.0f} ms)"
+        )
+
+
+class TestAddStartup:
+    """Duplicate detection in `nightswatch add` must start within budget."""
+
+    def test_add_duplicate_within_budget(
+        self,
+        temp_config_with_channel,
+        mock_yt_dlp_existing,
+        run_nightswatch,
+        run_script,
+        baseline_noop,
+    ):
+        """
+        Re-adding an existing channel should be detected within budget.
+
+        Covers everything nightswatch does on this path except the yt-dlp
+        lookups themselves: the mock logs each call, and one measured mock
+        call is subtracted per lookup nightswatch actually made.
+        """
+        url = "https://youtube.com/@TestChannel"
+        kwargs = {
+            "config": temp_config_with_channel,
+            "path_prepend": mock_yt_dlp_existing.parent,
+        }
+
+        (command, baseline), (result, _) = best_times(
+            lambda: run_nightswatch("add", url, **kwargs),
+            lambda: run_script(baseline_noop, **kwargs),
+        )
+
+        call_log = mock_yt_dlp_existing.parent / "calls.log"
+        lookups = len(call_log.read_text().splitlines()) // RUNS
+        (lookup,), _ = best_times(
+            lambda: run_script(
+                mock_yt_dlp_existing, "yt-dlp", "--print", "channel_id", url,
+                **kwargs,
+            ),
+        )
+        elapsed = command - baseline - lookups * lookup
+
+        assert result.returncode == 0
+        assert "already" in result.stdout.lower()
+        assert elapsed < STARTUP_BUDGET_SECONDS, (
+            f"add (duplicate) took {elapsed * 1000:.1f} ms over baseline "
+            f"after {lookups} yt-dlp lookups "
+            f"(budget {STARTUP_BUDGET_SECONDS * 1000:.0f} ms)"
+        )
@@ -0,0 +1,264 @@
+"""
+Tests for nightswatch `trends` command.
+
+Gate Pattern: These tests must pass before changes to nightswatch trends are accepted.
+Run with: pytest ~/code/ytmon/tests/ -v
+
+The corpus is seeded the way real transcripts arrive: through `nightswatch grab`
+with mocked `ytmon` (transcript text) and `uvx yt-dlp` (channel and upload date).
+grab stores under `~/.local/share/ytmon/` and updates the trends index as it
+goes; HOME is redirected to a temp dir so the real store is never touched.
+"""
+import re
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+# `trends` is not in nightswatch yet. Strict xfail keeps the gate green until
+# it ships, and turns red the moment these start passing so the marker is removed.
+pytestmark = pytest.mark.xfail(
+    strict=True, reason="nightswatch trends not implemented yet"
+)
+
+CHANNEL_A = "UCaaa111111111111111111"
+CHANNEL_B = "UCbbb222222222222222222"
+
+# Term that appears only in this week's Channel Alpha transcripts.
+RISING_TERM_A = "quantum"
+# Term that appears only in this week's Channel Beta transcripts.
+RISING_TERM_B = "sourdough"
+# Words spoken at the same rate every week on both channels.
+FILLER = "lantern meadow kettle harbor"
+
+VOCABULARY = {RISING_TERM_A, RISING_TERM_B, *FILLER.split()}
+
+
+def printed_terms(output):
+    """Corpus terms in the order they first appear in trends output."""
+    terms = []
+    for word in re.findall(r"\w+", output.lower()):
+        if word in VOCABULARY and word not in terms:
+            terms.append(word)
+    return terms
+
+
+@pytest.fixture
+def isolated_env(tmp_path):
+    """Env overrides that point the data dir at an empty temp HOME."""
+    home = tmp_path / "home"
+    home.mkdir()
+    return {
+        "HOME": str(home),
+        "XDG_DATA_HOME": str(home / ".local" / "share"),
+    }
+
+
+@pytest.fixture
+def grab_transcripts(
+    tmp_path, temp_config_with_channels, isolated_env, run_nightswatch
+):
+    """
+    Store transcripts through `nightswatch grab`.
+
+    Takes {video_id: (channel_id, upload_day, text)} and grabs each video with
+    mocks that answer for that video only.
+    """
+    def _grab(videos):
+        mock_dir = tmp_path / "mock_corpus"
+        mock_dir.mkdir(exist_ok=True)
+
+        ytmon_cases = "".join(
+            f'*"v={video_id}"*) echo "{text}" ;;\n'
+            for video_id, (_, _, text) in videos.items()
+        )
+        (mock_dir / "ytmon").write_text(
+            f'#!/bin/bash\ncase "$*" in\n{ytmon_cases}*) exit 1 ;;\nesac\n'
+        )
+
+        uvx_cases = "".join(
+            f'*"v={video_id}"*) channel_id="{channel_id}"; '
+            f'upload_date="{day.strftime("%Y%m%d")}" ;;\n'
+            for video_id, (channel_id, day, _) in videos.items()
+        )
+        (mock_dir / "uvx").write_text(f'''#!/bin/bash
+case "$*" in
+{uvx_cases}*) exit 1 ;;
+esac
+if [[ "$*" == *"--print channel_id"* ]]; then
+    echo "$channel_id"
+elif [[ "$*" == *"--print upload_date"* ]]; then
+    echo "$upload_date"
+elif [[ "$*" == *"--print channel"* ]]; then
+    echo "Channel $channel_id"
+fi
+''')
+        for script in ("ytmon", "uvx"):
+            (mock_dir / script).chmod(0o755)
+
+        for video_id in videos:
+            result = run_nightswatch(
+                "grab", f"https://youtube.com/watch?v={video_id}",
+                config=temp_config_with_channels,
+                path_prepend=mock_dir,
+                env_overrides=isolated_env,
+            )
+            assert result.returncode == 0, result.stderr
+
+    return _grab
+
+
+@pytest.fixture
+def seeded_corpus(grab_transcripts, isolated_env):
+    """
+    Two channels, two weeks of transcripts each, relative to today.
+
+    Last week both channels only say the filler; this week Channel Alpha
+    starts talking about RISING_TERM_A and Channel Beta about RISING_TERM_B.
+    """
+    this_week = date.today() - timedelta(days=1)
+    last_week = date.today() - timedelta(days=8)
+    grab_transcripts({
+        "alphaOld001": (CHANNEL_A, last_week, FILLER),
+        "betaOld0001": (CHANNEL_B, last_week, FILLER),
+        "alphaNew001": (
+            CHANNEL_A, this_week, f"{FILLER} " + f"{RISING_TERM_A} " * 4
+        ),
+        "betaNew0001": (
+            CHANNEL_B, this_week, f"{FILLER} " + f"{RISING_TERM_B} " * 4
+        ),
+    })
+    return isolated_env
+
+
+class TestTrends:
+    """Tests for the nightswatch trends command."""
+
+    def test_trends_empty_corpus_succeeds(
+        self, temp_config_with_channels, isolated_env, run_nightswatch
+    ):
+        """Trends with no stored transcripts should say so, not crash."""
+        result = run_nightswatch(
+            "trends",
+            config=temp_config_with_channels,
+            env_overrides=isolated_env,
+        )
+
+        assert result.returncode == 0
+        assert "no transcripts" in result.stdout.lower()
+
+    def test_trends_uses_grabbed_transcripts(
+        self, temp_config_with_channels, seeded_corpus, run_nightswatch
+    ):
+        """Transcripts stored by grab should land in the data dir and feed trends."""
+        data_dir = Path(seeded_corpus["HOME"]) / ".local" / "share" / "ytmon"
+        assert data_dir.is_dir() and any(data_dir.iterdir())
+
+        result = run_nightswatch(
+            "trends",
+            config=temp_config_with_channels,
+            env_overrides=seeded_corpus,
+        )
+
+        assert result.returncode == 0
+        assert "no transcripts" not in result.stdout.lower()
+        assert RISING_TERM_A in printed_terms(result.stdout)
+
+    def test_trends_ranks_rising_terms_first(
+        self, temp_config_with_channels, seeded_corpus, run_nightswatch
+    ):
+        """Terms new this week should be listed before terms said every week."""
+        result = run_nightswatch(
+            "trends",
+            config=temp_config_with_channels,
+            env_overrides=seeded_corpus,
+        )
+
+        assert result.returncode == 0
+        terms = printed_terms(result.stdout)
+        assert set(terms[:2]) == {RISING_TERM_A, RISING_TERM_B}
+
+    def test_trends_top_limits_output(
+        self, temp_config_with_channels, seeded_corpus, run_nightswatch
+    ):
+        """--top N should print only the N highest-rising terms."""
+        result = run_nightswatch(
+            "trends", "--top", "1",
+            config=temp_config_with_channels,
+            env_overrides=seeded_corpus,
+        )
+
+        assert result.returncode == 0
+        terms = printed_terms(result.stdout)
+        assert len(terms) == 1
+        assert terms[0] in {RISING_TERM_A, RISING_TERM_B}
+
+    def test_trends_channel_filter(
+        self, temp_config_with_channels, seeded_corpus, run_nightswatch
+    ):
+        """--channel should exclude transcripts from other channels."""
+        result = run_nightswatch(
+            "trends", "--channel", CHANNEL_B,
+            config=temp_config_with_channels,
+            env_overrides=seeded_corpus,
+        )
+
+        assert result.returncode == 0
+        terms = printed_terms(result.stdout)
+        assert RISING_TERM_B in terms
+        assert RISING_TERM_A not in terms
+
+    def test_trends_since_filter(
+        self, temp_config_with_channels, seeded_corpus, run_nightswatch
+    ):
+        """--since should exclude transcripts uploaded before the given date."""
+        month_ago = (date.today() - timedelta(days=30)).isoformat()
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+
+        included = run_nightswatch(
+            "trends", "--since", month_ago,
+            config=temp_config_with_channels,
+            env_overrides=seeded_corpus,
+        )
+        excluded = run_nightswatch(
+            "trends", "--since", tomorrow,
+            config=temp_config_with_channels,
+            env_overrides=seeded_corpus,
+        )
+
+        assert included.returncode == 0
+        assert RISING_TERM_A in printed_terms(included.stdout)
+        assert excluded.returncode == 0
+        assert printed_terms(excluded.stdout) == []
+
+
+class TestTrendsEdgeCases:
+    """Edge case tests for trends command."""
+
+    def test_trends_invalid_since_shows_usage(
+        self, temp_config_dir, isolated_env, run_nightswatch
+    ):
+        """A malformed --since date should fail with trends usage."""
+        result = run_nightswatch(
+            "trends", "--since", "last-tuesday",
+            config=temp_config_dir,
+            env_overrides=isolated_env,
+        )
+
+        assert result.returncode != 0
+        assert "usage" in result.stderr.lower()
+        assert "trends" in result.stderr.lower()
+
+    def test_trends_missing_option_value_shows_usage(
+        self, temp_config_dir, isolated_env, run_nightswatch
+    ):
+        """--channel without a value should fail with trends usage."""
+        result = run_nightswatch(
+            "trends", "--channel",
+            config=temp_config_dir,
+            env_overrides=isolated_env,
+        )
+
+        assert result.returncode != 0
+        assert "usage" in result.stderr.lower()
+        assert "trends" in result.stderr.lower()